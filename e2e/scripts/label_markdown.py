@@ -60,6 +60,9 @@ Horizontal Rule:
 
 """
 
+options = ("Option 1", "Option 2", "Option 3")
+colors = ("Blue", "Purple", "Green")
+
 # Invalid Markdown: images, table elements, headings, unordered/ordered lists, task lists, horizontal rules, & blockquotes
 with st.container():
     st.subheader(
@@ -67,11 +70,11 @@ with st.container():
     )
     st.button(image)
     st.checkbox(table)
-    st.radio(heading_1, ["Option 1", "Option 2", "Option 3"])
-    st.selectbox(heading_2, ["Option 1", "Option 2", "Option 3"])
-    st.multiselect(ordered_list, ["Blue", "Purple", "Green"])
+    st.radio(heading_1, options)
+    st.selectbox(heading_2, options)
+    st.multiselect(ordered_list, colors)
     st.slider(unordered_list, 0, 10, 1)
-    st.select_slider(task_list, ["Blue", "Purple", "Green"])
+    st.select_slider(task_list, colors)
     st.text_input(blockquote)
     st.number_input(horizontal_rule)
     st.text_area(image)
@@ -92,11 +95,11 @@ with st.container():
     )
     st.button(valid_label)
     st.checkbox(valid_label)
-    st.radio(valid_label, ["Option 1", "Option 2", "Option 3"])
-    st.selectbox(valid_label, ["Option 1", "Option 2", "Option 3"])
-    st.multiselect(valid_label, ["Blue", "Purple", "Green"])
+    st.radio(valid_label, options)
+    st.selectbox(valid_label, options)
+    st.multiselect(valid_label, colors)
     st.slider(valid_label, 0, 10, 1)
-    st.select_slider(valid_label, ["Blue", "Purple", "Green"])
+    st.select_slider(valid_label, colors)
     st.text_input(valid_label)
     st.number_input(valid_label)
     st.text_area(valid_label)
@@ -124,11 +127,11 @@ with st.container():
     st.subheader("✅ Entirely Allowed - Colored text")
     st.button(color_label)
     st.checkbox(color_label)
-    st.radio(color_label, ["Option 1", "Option 2", "Option 3"])
-    st.selectbox(color_label, ["Option 1", "Option 2", "Option 3"])
-    st.multiselect(color_label, ["Blue", "Purple", "Green"])
+    st.radio(color_label, options)
+    st.selectbox(color_label, options)
+    st.multiselect(color_label, colors)
     st.slider(color_label, 0, 10, 1)
-    st.select_slider(color_label, ["Blue", "Purple", "Green"])
+    st.select_slider(color_label, colors)
     st.text_input(color_label)
     st.number_input(color_label)
     st.text_area(color_label)
@@ -158,11 +161,11 @@ with st.container():
 with st.container():
     st.subheader("✅ Allowed outside of buttons - Links")
     st.checkbox(link_label)
-    st.radio(link_label, ["Option 1", "Option 2", "Option 3"])
-    st.selectbox(link_label, ["Option 1", "Option 2", "Option 3"])
-    st.multiselect(link_label, ["Blue", "Purple", "Green"])
+    st.radio(link_label, options)
+    st.selectbox(link_label, options)
+    st.multiselect(link_label, colors)
     st.slider(link_label, 0, 10, 1)
-    st.select_slider(link_label, ["Blue", "Purple", "Green"])
+    st.select_slider(link_label, colors)
     st.text_input(link_label)
     st.number_input(link_label)
     st.text_area(link_label)
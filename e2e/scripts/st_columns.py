@@ -31,17 +31,6 @@ for c in st.columns((1, 2, 3, 4)):
     c.image(CAT_IMAGE)
 
 # Various column gaps
-c4, c5, c6 = st.columns(3, gap="small")
-c4.image(CAT_IMAGE)
-c5.image(CAT_IMAGE)
-c6.image(CAT_IMAGE)
-
-c7, c8, c9 = st.columns(3, gap="medium")
-c7.image(CAT_IMAGE)
-c8.image(CAT_IMAGE)
-c9.image(CAT_IMAGE)
-
-c10, c11, c12 = st.columns(3, gap="large")
-c10.image(CAT_IMAGE)
-c11.image(CAT_IMAGE)
-c12.image(CAT_IMAGE)
+for gap in ("small", "medium", "large"):
+    for c in st.columns(3, gap=gap):
+        c.image(CAT_IMAGE)
@@ -54,8 +54,8 @@ def create_gif(size, frames=1):
     return data.getvalue()
 
 
-img = np.repeat(0, 10000).reshape(100, 100)
-img800 = np.repeat(0, 640000).reshape(800, 800)
+img = np.zeros((100, 100), dtype=np.uint8)
+img800 = np.zeros((800, 800), dtype=np.uint8)
 gif = create_gif(64, frames=32)
 
 st.image(img, caption="Black Square as JPEG", output_format="JPEG", width=100)
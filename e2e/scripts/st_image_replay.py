@@ -50,7 +50,7 @@ def create_gif(size, frames=1):
     return data.getvalue()
 
 
-img = np.repeat(0, 10000).reshape(100, 100)
+img = np.zeros((100, 100), dtype=np.uint8)
 gif = create_gif(64, frames=32)
 
 
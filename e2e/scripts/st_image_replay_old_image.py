@@ -16,7 +16,7 @@ import numpy as np
 
 import streamlit as st
 
-img = np.repeat(0, 10000).reshape(100, 100)
+img = np.zeros((100, 100), dtype=np.uint8)
 
 
 @st.experimental_memo
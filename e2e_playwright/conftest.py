@@ -39,6 +39,9 @@ from PIL import Image
 from playwright.sync_api import ElementHandle, Locator, Page
 from pytest import FixtureRequest
 
+# Matches the parameter ids of a parametrized test, e.g. "[light_theme-chromium]":
+TEST_PARAMETER_IDS_PATTERN = re.compile(r"\[(.*?)\]")
+
 
 class AsyncSubprocess:
     """A context manager. Wraps subprocess. Popen to capture output safely."""
@@ -295,7 +298,7 @@ def assert_snapshot(
 
     snapshot_file_suffix = ""
     # Extract the parameter ids if they exist
-    match = re.search(r"\[(.*?)\]", request.node.name)
+    match = TEST_PARAMETER_IDS_PATTERN.search(request.node.name)
     if match:
         snapshot_file_suffix = f"[{match.group(1)}]"
 
@@ -376,6 +379,11 @@ def assert_snapshot(
             test_failure_messages.append(f"Missing snapshot for {snapshot_file_name}")
             return
 
+        if snapshot_file_path.read_bytes() == img_bytes:
+            # The screenshot is byte-identical to the snapshot from past runs,
+            # so we can skip decoding both images and diffing the pixels.
+            return
+
         from pixelmatch.contrib.PIL import pixelmatch
 
         # Compare the new screenshot with the screenshot from past runs:
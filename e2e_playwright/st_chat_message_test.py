@@ -21,11 +21,14 @@ def test_renders_chat_messages_correctly_1(
     themed_app: Page, assert_snapshot: ImageCompareFunction
 ):
     """Test if the chat messages render correctly"""
-    # Wait a bit more to allow all images to load:
     chat_message_elements = themed_app.locator(".stChatMessage")
     expect(chat_message_elements).to_have_count(10)
+    # Wait for all avatar images to load instead of sleeping before every snapshot:
+    themed_app.wait_for_function(
+        """() => Array.from(document.querySelectorAll(".stChatMessage img")).every(
+            (img) => img.complete
+        )"""
+    )
+    # Element screenshots scroll the element into view on their own:
     for i, element in enumerate(chat_message_elements.all()):
-        element.scroll_into_view_if_needed()
-        # Wait a bit more to allow the avatar images to load:
-        themed_app.wait_for_timeout(100)
         assert_snapshot(element, name=f"chat_message-{i}")
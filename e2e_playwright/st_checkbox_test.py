@@ -46,8 +46,7 @@ def test_checkbox_initial_values(app: Page):
         "checkbox 8 - value: False",
     ]
 
-    for markdown_element, expected_text in zip(markdown_elements.all(), expected):
-        expect(markdown_element).to_have_text(expected_text, use_inner_text=True)
+    expect(markdown_elements).to_have_text(expected, use_inner_text=True)
 
 
 def test_checkbox_values_on_click(app: Page):
@@ -71,5 +70,4 @@ def test_checkbox_values_on_click(app: Page):
         "checkbox 8 - value: True",
     ]
 
-    for markdown_element, expected_text in zip(markdown_elements.all(), expected):
-        expect(markdown_element).to_have_text(expected_text, use_inner_text=True)
+    expect(markdown_elements).to_have_text(expected, use_inner_text=True)
@@ -59,7 +59,6 @@ def test_expander_collapses_and_expands(app: Page):
     toggle = expander_header.locator("svg").first
     expect(toggle).to_be_visible()
     expander_header.click()
-    toggle = expander_header.locator("svg").first
     expect(toggle).to_be_visible()
 
     # Starts collapsed
@@ -68,7 +67,6 @@ def test_expander_collapses_and_expands(app: Page):
     toggle = expander_header.locator("svg").first
     expect(toggle).to_be_visible()
     expander_header.click()
-    toggle = expander_header.locator("svg").first
     expect(toggle).to_be_visible()
 
 
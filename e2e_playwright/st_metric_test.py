@@ -15,39 +15,42 @@ from playwright.sync_api import Page, expect
 
 from e2e_playwright.conftest import ImageCompareFunction
 
+METRIC_CONTAINER_IDENTIFIER = "[data-testid='metric-container']"
+METRIC_LABEL_IDENTIFIER = "[data-testid='stMetricLabel']"
+METRIC_VALUE_IDENTIFIER = "[data-testid='stMetricValue']"
+METRIC_DELTA_IDENTIFIER = "[data-testid='stMetricDelta']"
+
 
 def test_first_metric_in_first_row(app: Page):
-    expect(app.locator("[data-testid='stMetricLabel']").nth(0)).to_have_text(
-        "User growth"
-    )
-    expect(app.locator("[data-testid='stMetricValue']").nth(0)).to_have_text(" 123 ")
-    expect(app.locator("[data-testid='stMetricDelta']").nth(0)).to_have_text(" 123 ")
+    expect(app.locator(METRIC_LABEL_IDENTIFIER).nth(0)).to_have_text("User growth")
+    expect(app.locator(METRIC_VALUE_IDENTIFIER).nth(0)).to_have_text(" 123 ")
+    expect(app.locator(METRIC_DELTA_IDENTIFIER).nth(0)).to_have_text(" 123 ")
 
 
 def test_second_metric_in_first_row(app: Page):
-    expect(app.locator("[data-testid='stMetricLabel']").nth(2)).to_have_text("S&P 500")
-    expect(app.locator("[data-testid='stMetricValue']").nth(2)).to_have_text(" -4.56 ")
-    expect(app.locator("[data-testid='stMetricDelta']").nth(2)).to_have_text(" -50 ")
+    expect(app.locator(METRIC_LABEL_IDENTIFIER).nth(2)).to_have_text("S&P 500")
+    expect(app.locator(METRIC_VALUE_IDENTIFIER).nth(2)).to_have_text(" -4.56 ")
+    expect(app.locator(METRIC_DELTA_IDENTIFIER).nth(2)).to_have_text(" -50 ")
 
 
 def test_third_metric_in_first_row(app: Page):
-    expect(app.locator("[data-testid='stMetricLabel']").nth(4)).to_have_text(
+    expect(app.locator(METRIC_LABEL_IDENTIFIER).nth(4)).to_have_text(
         "Apples I've eaten"
     )
-    expect(app.locator("[data-testid='stMetricValue']").nth(4)).to_have_text(" 23k ")
-    expect(app.locator("[data-testid='stMetricDelta']").nth(4)).to_have_text(" -20 ")
+    expect(app.locator(METRIC_VALUE_IDENTIFIER).nth(4)).to_have_text(" 23k ")
+    expect(app.locator(METRIC_DELTA_IDENTIFIER).nth(4)).to_have_text(" -20 ")
 
 
 def test_green_up_arrow_render(themed_app: Page, assert_snapshot: ImageCompareFunction):
     assert_snapshot(
-        themed_app.locator('[data-testid="metric-container"]').nth(0),
+        themed_app.locator(METRIC_CONTAINER_IDENTIFIER).nth(0),
         name="metric-container-green",
     )
 
 
 def test_red_down_arrow_render(themed_app: Page, assert_snapshot: ImageCompareFunction):
     assert_snapshot(
-        themed_app.locator('[data-testid="metric-container"]').nth(2),
+        themed_app.locator(METRIC_CONTAINER_IDENTIFIER).nth(2),
         name="metric-container-red",
     )
 
@@ -56,7 +59,7 @@ def test_gray_down_arrow_render(
     themed_app: Page, assert_snapshot: ImageCompareFunction
 ):
     assert_snapshot(
-        themed_app.locator('[data-testid="metric-container"]').nth(4),
+        themed_app.locator(METRIC_CONTAINER_IDENTIFIER).nth(4),
         name="metric-container-gray",
     )
 
@@ -65,7 +68,7 @@ def test_help_shows_up_without_columns(
     themed_app: Page, assert_snapshot: ImageCompareFunction
 ):
     assert_snapshot(
-        themed_app.locator('[data-testid="metric-container"]').nth(6),
+        themed_app.locator(METRIC_CONTAINER_IDENTIFIER).nth(6),
         name="metric-with-help",
     )
 
@@ -74,7 +77,7 @@ def test_none_results_in_dash_in_value(
     themed_app: Page, assert_snapshot: ImageCompareFunction
 ):
     assert_snapshot(
-        themed_app.locator('[data-testid="metric-container"]').nth(7),
+        themed_app.locator(METRIC_CONTAINER_IDENTIFIER).nth(7),
         name="metric-with-none-value",
     )
 
@@ -82,11 +85,9 @@ def test_none_results_in_dash_in_value(
 def test_label_visibility_set_to_hidden(
     themed_app: Page, assert_snapshot: ImageCompareFunction
 ):
-    expect(themed_app.locator("[data-testid='stMetricLabel']").nth(3)).to_have_text(
-        "Test 4"
-    )
+    expect(themed_app.locator(METRIC_LABEL_IDENTIFIER).nth(3)).to_have_text("Test 4")
     assert_snapshot(
-        themed_app.locator('[data-testid="metric-container"]').nth(3),
+        themed_app.locator(METRIC_CONTAINER_IDENTIFIER).nth(3),
         name="metric-label-hidden",
     )
 
@@ -94,11 +95,9 @@ def test_label_visibility_set_to_hidden(
 def test_label_visibility_set_to_collapse(
     themed_app: Page, assert_snapshot: ImageCompareFunction
 ):
-    expect(themed_app.locator("[data-testid='stMetricLabel']").nth(5)).to_have_text(
-        "Test 5"
-    )
+    expect(themed_app.locator(METRIC_LABEL_IDENTIFIER).nth(5)).to_have_text("Test 5")
     assert_snapshot(
-        themed_app.locator('[data-testid="metric-container"]').nth(5),
+        themed_app.locator(METRIC_CONTAINER_IDENTIFIER).nth(5),
         name="metric-label-collapse",
     )
 
@@ -107,6 +106,6 @@ def test_ellipses_and_help_shows_up_properly(
     themed_app: Page, assert_snapshot: ImageCompareFunction
 ):
     assert_snapshot(
-        themed_app.locator('[data-testid="metric-container"]').nth(8),
+        themed_app.locator(METRIC_CONTAINER_IDENTIFIER).nth(8),
         name="metric-help-and-ellipses",
     )
@@ -123,14 +123,11 @@ def test_multiselect_long_values_in_dropdown(
 
 def test_multiselect_register_callback(app: Page):
     """Should call the callback when an option is selected."""
+    text_elements = app.locator("[data-testid='stText']")
     app.locator(".stMultiSelect").nth(10).locator("input").click()
     app.locator("li").first.click()
-    expect(app.locator("[data-testid='stText']").nth(10)).to_have_text(
-        "value 11: ['male']"
-    )
-    expect(app.locator("[data-testid='stText']").nth(11)).to_have_text(
-        "multiselect changed: True"
-    )
+    expect(text_elements.nth(10)).to_have_text("value 11: ['male']")
+    expect(text_elements.nth(11)).to_have_text("multiselect changed: True")
 
 
 def test_multiselect_max_selections_form(app: Page):
@@ -64,8 +64,7 @@ def test_number_input_has_correct_default_values(app: Page):
         "number input 12 (value from state & min=1) - value: 10",
     ]
 
-    for markdown_element, expected_text in zip(markdown_elements.all(), expected):
-        expect(markdown_element).to_have_text(expected_text, use_inner_text=True)
+    expect(markdown_elements).to_have_text(expected, use_inner_text=True)
 
 
 def test_number_input_shows_instructions_when_dirty(
@@ -94,7 +93,7 @@ def test_number_input_has_correct_value_on_increment_click(app: Page):
     number_input_up_buttons = app.locator(".stNumberInput button.step-up")
     expect(number_input_up_buttons).to_have_count(11)
     for i, button in enumerate(number_input_up_buttons.all()):
-        if i not in [5, 9]:
+        if i not in {5, 9}:
             button.click()
 
     markdown_elements = app.locator(".stMarkdown")
@@ -115,8 +114,7 @@ def test_number_input_has_correct_value_on_increment_click(app: Page):
         "number input 12 (value from state & min=1) - value: 11",
     ]
 
-    for markdown_element, expected_text in zip(markdown_elements.all(), expected):
-        expect(markdown_element).to_have_text(expected_text, use_inner_text=True)
+    expect(markdown_elements).to_have_text(expected, use_inner_text=True)
 
 
 def test_number_input_has_correct_value_on_arrow_up(app: Page):
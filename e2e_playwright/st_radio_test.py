@@ -61,8 +61,7 @@ def test_radio_has_correct_default_values(app: Page):
         "value 13: None",
     ]
 
-    for markdown_element, expected_text in zip(markdown_elements.all(), expected):
-        expect(markdown_element).to_have_text(expected_text, use_inner_text=True)
+    expect(markdown_elements).to_have_text(expected, use_inner_text=True)
 
 
 def test_set_value_correctly_when_click(app: Page):
@@ -88,37 +87,33 @@ def test_set_value_correctly_when_click(app: Page):
         "value 13: male",
     ]
 
-    for markdown_element, expected_text in zip(
-        app.get_by_test_id("stMarkdown").all(), expected
-    ):
-        expect(markdown_element).to_have_text(expected_text, use_inner_text=True)
+    markdown_elements = app.get_by_test_id("stMarkdown")
+    expect(markdown_elements).to_have_text(expected, use_inner_text=True)
 
 
 def test_calls_callback_on_change(app: Page):
     """Test that it correctly calls the callback on change."""
-    radio_widget = app.get_by_test_id("stRadio").nth(11)
+    radio_widgets = app.get_by_test_id("stRadio")
+    markdown_elements = app.get_by_test_id("stMarkdown")
 
-    radio_widget.locator('label[data-baseweb="radio"]').first.click(force=True)
+    radio_widgets.nth(11).locator('label[data-baseweb="radio"]').first.click(force=True)
 
-    expect(app.get_by_test_id("stMarkdown").nth(11)).to_have_text(
+    expect(markdown_elements.nth(11)).to_have_text(
         "value 12: female",
         use_inner_text=True,
     )
-    expect(app.get_by_test_id("stMarkdown").nth(12)).to_have_text(
+    expect(markdown_elements.nth(12)).to_have_text(
         "radio changed: True",
         use_inner_text=True,
     )
 
-    # Change different date input to trigger delta path change
-    first_date_input_field = app.get_by_test_id("stRadio").first
-    first_date_input_field.locator('label[data-baseweb="radio"]').last.click(force=True)
+    # Change different radio widget to trigger delta path change
+    radio_widgets.first.locator('label[data-baseweb="radio"]').last.click(force=True)
 
-    expect(app.get_by_test_id("stMarkdown").first).to_have_text(
-        "value 1: male", use_inner_text=True
-    )
+    expect(markdown_elements.first).to_have_text("value 1: male", use_inner_text=True)
 
     # Test if value is still correct after delta path change
-    expect(app.get_by_test_id("stMarkdown").nth(11)).to_have_text(
+    expect(markdown_elements.nth(11)).to_have_text(
         "value 12: female",
         use_inner_text=True,
     )
@@ -59,8 +59,7 @@ def test_selectbox_has_correct_initial_values(app: Page):
         "value 11: male",
     ]
 
-    for markdown_element, expected_text in zip(markdown_elements.all(), expected):
-        expect(markdown_element).to_have_text(expected_text, use_inner_text=True)
+    expect(markdown_elements).to_have_text(expected, use_inner_text=True)
 
 
 def test_handles_option_selection(app: Page, assert_snapshot: ImageCompareFunction):
@@ -83,7 +82,7 @@ def test_handles_option_selection_via_typing(app: Page):
     selectbox_input = app.get_by_test_id("stSelectbox").nth(3).locator("input")
 
     # Type an option:
-    selectbox_input.type("e2e/scripts/st_warning.py")
+    selectbox_input.fill("e2e/scripts/st_warning.py")
     selectbox_input.press("Enter")
 
     # Check that selection worked:
@@ -99,7 +98,7 @@ def test_shows_correct_options_via_fuzzy_search(
     selectbox_input = app.get_by_test_id("stSelectbox").nth(3).locator("input")
 
     # Start typing:
-    selectbox_input.type("exp")
+    selectbox_input.fill("exp")
 
     # Check filtered options
     selection_dropdown = app.locator('[data-baseweb="popover"]').first
@@ -114,7 +113,7 @@ def test_empty_selectbox_behaves_correctly(
     empty_selectbox_input = app.get_by_test_id("stSelectbox").locator("input").nth(8)
 
     # Type an option:
-    empty_selectbox_input.type("male")
+    empty_selectbox_input.fill("male")
     empty_selectbox_input.press("Enter")
 
     expect(app.get_by_test_id("stMarkdown").nth(9)).to_have_text(
@@ -152,15 +151,18 @@ def test_keeps_value_on_selection_close(app: Page):
 
 def test_handles_callback_on_change_correctly(app: Page):
     """Test that it correctly calls the callback on change."""
+    selectbox_widgets = app.get_by_test_id("stSelectbox")
+    markdown_elements = app.get_by_test_id("stMarkdown")
+
     # Check initial state:
-    expect(app.get_by_test_id("stMarkdown").nth(7)).to_have_text(
+    expect(markdown_elements.nth(7)).to_have_text(
         "value 8: female", use_inner_text=True
     )
-    expect(app.get_by_test_id("stMarkdown").nth(8)).to_have_text(
+    expect(markdown_elements.nth(8)).to_have_text(
         "selectbox changed: False", use_inner_text=True
     )
 
-    app.get_by_test_id("stSelectbox").nth(7).locator("input").click()
+    selectbox_widgets.nth(7).locator("input").click()
 
     # Take a snapshot of the selection dropdown:
     selection_dropdown = app.locator('[data-baseweb="popover"]').first
@@ -168,23 +170,17 @@ def test_handles_callback_on_change_correctly(app: Page):
     selection_dropdown.locator("li").first.click()
 
     # Check that selection worked:
-    expect(app.get_by_test_id("stMarkdown").nth(7)).to_have_text(
-        "value 8: male", use_inner_text=True
-    )
-    expect(app.get_by_test_id("stMarkdown").nth(8)).to_have_text(
+    expect(markdown_elements.nth(7)).to_have_text("value 8: male", use_inner_text=True)
+    expect(markdown_elements.nth(8)).to_have_text(
         "selectbox changed: True", use_inner_text=True
     )
 
     # Change different date input to trigger delta path change
-    empty_selectbox_input = app.get_by_test_id("stSelectbox").locator("input").first
+    empty_selectbox_input = selectbox_widgets.locator("input").first
 
     # Type an option:
-    empty_selectbox_input.type("female")
+    empty_selectbox_input.fill("female")
     empty_selectbox_input.press("Enter")
 
-    expect(app.get_by_test_id("stMarkdown").first).to_have_text(
-        "value 1: female", use_inner_text=True
-    )
-    expect(app.get_by_test_id("stMarkdown").nth(7)).to_have_text(
-        "value 8: male", use_inner_text=True
-    )
+    expect(markdown_elements.first).to_have_text("value 1: female", use_inner_text=True)
+    expect(markdown_elements.nth(7)).to_have_text("value 8: male", use_inner_text=True)
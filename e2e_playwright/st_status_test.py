@@ -47,15 +47,15 @@ def test_running_state(app: Page):
 
 def test_status_collapses_and_expands(app: Page):
     """Test that a status collapses and expands."""
-    expander_content = "Doing some work..."
     running_status = app.get_by_test_id("stExpander").nth(0)
+    expander_content = running_status.get_by_text("Doing some work...")
     # Starts expanded:
-    expect(running_status.get_by_text(expander_content)).to_be_visible()
+    expect(expander_content).to_be_visible()
 
     expander_header = running_status.locator(".streamlit-expanderHeader")
     # Collapse:
     expander_header.click()
-    expect(running_status.get_by_text(expander_content)).not_to_be_attached()
+    expect(expander_content).not_to_be_attached()
     # Expand:
     expander_header.click()
-    expect(running_status.get_by_text(expander_content)).to_be_visible()
+    expect(expander_content).to_be_visible()
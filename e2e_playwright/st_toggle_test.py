@@ -44,8 +44,7 @@ def test_toggle_initial_values(app: Page):
         "toggle 8 - value: False",
     ]
 
-    for markdown_element, expected_text in zip(markdown_elements.all(), expected):
-        expect(markdown_element).to_have_text(expected_text, use_inner_text=True)
+    expect(markdown_elements).to_have_text(expected, use_inner_text=True)
 
 
 def test_toggle_values_on_click(app: Page):
@@ -69,5 +68,4 @@ def test_toggle_values_on_click(app: Page):
         "toggle 8 - value: True",
     ]
 
-    for markdown_element, expected_text in zip(markdown_elements.all(), expected):
-        expect(markdown_element).to_have_text(expected_text, use_inner_text=True)
+    expect(markdown_elements).to_have_text(expected, use_inner_text=True)